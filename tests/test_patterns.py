@@ -0,0 +1,41 @@
+from random import Random
+
+import numpy as np
+
+from wordle_solver.bench import random_histories
+from wordle_solver.clues import CompiledRules, encode, filter_by_rules, letter_counts, merge_clues
+from wordle_solver.game import feedback
+from wordle_solver.table import get_patterns, PatternTable
+from wordle_solver.words import default_words
+
+REPEATED = ['sassy', 'eerie', 'llama', 'geese', 'abbey', 'lolly', 'mamma', 'speed', 'tares', 'alarm', 'eater']
+
+
+def test_patterns_match_feedback_with_repeated_letters():
+    patterns = get_patterns(encode(REPEATED), encode(REPEATED))
+    for i, guess in enumerate(REPEATED):
+        for j, answer in enumerate(REPEATED):
+            assert patterns[i, j] == int(feedback(guess, answer), 3), (guess, answer)
+
+
+def test_patterns_match_feedback_across_blocks():
+    rng = Random(0)
+    words = REPEATED + rng.sample(default_words(), 300)
+    # A small block size mixes guesses with and without repeated letters across several blocks
+    patterns = get_patterns(encode(words), encode(words[:100]), block_size=64)
+    for i, guess in enumerate(words):
+        for j, answer in enumerate(words[:100]):
+            assert patterns[i, j] == int(feedback(guess, answer), 3), (guess, answer)
+
+
+def test_table_candidates_are_a_subset_of_the_rules():
+    rng = Random(0)
+    words = REPEATED + rng.sample(default_words(), 500)
+    table = PatternTable(words, words)
+    letters = encode(words)
+    counts = letter_counts(letters)
+    for tries in range(1, 4):
+        for history in random_histories(rng, words, tries, 50):
+            mask = CompiledRules(merge_clues(history))(letters, counts)
+            assert filter_by_rules(history, words) == [words[i] for i in np.flatnonzero(mask)]
+            assert set(table.filter(history)) <= set(np.flatnonzero(mask))
@@ -0,0 +1,31 @@
+"""
+A wordle solver
+
+Example usage:
+    from wordle_solver import Solver
+    solver = Solver()
+    solver.candidates(['black=01122', 'white=01122'])
+    solver.rank(['black=01122'], top=5)
+
+(0 for grey, 1 for yellow, 2 for green)
+
+Importing the package is cheap: NumPy, the word list and the pattern table are only loaded
+once something needs them.
+"""
+
+_exports = {
+    'Solver': 'solver',
+    'filter_candidates': 'solver',
+    'rank_guesses': 'solver',
+    'feedback': 'game',
+    'InvalidTry': 'game',
+}
+
+__all__ = list(_exports)
+
+
+def __getattr__(name):
+    if name not in _exports:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    from importlib import import_module
+    return getattr(import_module(f'.{_exports[name]}', __name__), name)
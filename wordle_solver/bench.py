@@ -0,0 +1,48 @@
+import statistics
+import time
+import tracemalloc
+
+import numpy as np
+
+from .game import feedback
+
+
+def random_histories(rng, words, tries, games):
+    histories = []
+    for _ in range(games):
+        answer = rng.choice(words)
+        histories.append([f'{g}={feedback(g, answer)}' for g in rng.sample(words, tries)])
+    return histories
+
+
+def worst_histories(rng, table, tries, games, choices=20):
+    """Histories where each try is the one of a few random guesses leaving the most candidates."""
+    histories = []
+    for _ in range(games):
+        answer = rng.randrange(len(table.answers))
+        candidates = np.arange(len(table.answers))
+        history = []
+        for _ in range(tries):
+            guesses = rng.sample(table.guesses, choices)
+            survivors = [candidates[table.row(g)[candidates] == table.row(g)[answer]] for g in guesses]
+            worst = max(range(choices), key=lambda i: len(survivors[i]))
+            candidates = survivors[worst]
+            history.append(f'{guesses[worst]}={feedback(guesses[worst], table.answers[answer])}')
+        histories.append(history)
+    return histories
+
+
+def measure(run, repeat):
+    """Median and best time of run() over repeat calls, then its peak traced memory in one more call."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    # Tracing slows Python code down a lot, so memory gets a run of its own
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {'seconds': statistics.median(times), 'best_seconds': min(times), 'repeat': repeat,
+            'peak_traced_bytes': peak}
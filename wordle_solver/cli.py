@@ -0,0 +1,571 @@
+import argparse
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import time
+from collections import Counter
+from random import Random
+
+import numpy as np
+
+from .bench import measure, random_histories, worst_histories
+from .clues import CompiledRules, encode, filter_by_rules, get_rules, letter_counts, merge_clues
+from .game import feedback, InvalidTry, pattern_string, validate_tries
+from .minimax import analyze_openers, Minimax, minimax_openers
+from .multi import best_multi_guesses, MultiSession, validate_multi_tries
+from .ranking import best_guesses, best_hard_guesses
+from .server import SolverService
+from .session import LRUCache
+from .solver import Solver
+from .stats import NO_STATS, report_stats, Stats, stats_hooks
+from .strategy import build_tree_parallel, simulate_games, Strategy
+from .table import default_cache_dir
+from .tree import DecisionTree, save_tree
+from .words import pack_words, read_words, word_list_digest
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] in commands:
+        commands[sys.argv[1]](sys.argv[2:])
+    else:
+        solve(sys.argv[1:])
+
+
+def solve(argv):
+    start = time.perf_counter()
+    args = parse_arguments(argv)
+    stats = Stats() if args.stats or stats_hooks else NO_STATS
+    stats.record('parse', time.perf_counter() - start)
+    stats.add('tries', len(args.tries))
+    if args.tree:
+        try:
+            with stats.stage('load'):
+                tree = DecisionTree(args.tree, word_list_digest(*word_lists(args)))
+            with stats.stage('tree'):
+                guess = tree.next_guess(args.tries)
+        except (OSError, ValueError) as e:
+            print(e, file=sys.stderr)
+            sys.exit(1)
+        with stats.stage('output'):
+            if guess:
+                print(guess)
+        report_stats(stats)
+        return
+    if args.backend == 'table':
+        with stats.stage('load'):
+            table = open_table(args)
+        with stats.stage('filter'):
+            indices = table.filter(args.tries, stats=stats)
+        if args.top:
+            with stats.stage('rank'):
+                if args.hard:
+                    ranked = best_hard_guesses(table, args.tries, indices, args.top, args.metric, args.lookahead)
+                else:
+                    ranked = best_guesses(table, indices, args.top, args.metric)
+            with stats.stage('output'):
+                for word, score in ranked:
+                    print(f'{word} {score:.3f}')
+            report_stats(stats)
+            return
+        candidates = [table.answers[i] for i in table.by_weight(indices)]
+    elif args.top:
+        print('Ranking needs the table backend', file=sys.stderr)
+        sys.exit(1)
+    elif args.backend == 'rules':
+        with stats.stage('load'):
+            answers = word_lists(args)[1]
+            letters = encode(answers)
+            counts = letter_counts(letters)
+        clues = merge_clues(args.tries, stats)
+        with stats.stage('rules'):
+            rules = CompiledRules(clues)
+        stats.add('rules', len(rules))
+        with stats.stage('filter'):
+            indices = np.flatnonzero(rules(letters, counts))
+        if args.weights:
+            indices = indices[np.argsort(-answer_weights(args)[indices], kind='stable')]
+        candidates = [answers[i] for i in indices]
+        stats.add('tested', len(answers))
+        stats.add('survivors', len(candidates))
+    else:
+        with stats.stage('load'):
+            answers = word_lists(args)[1]
+        candidates = filter_by_rules(args.tries, answers, stats)
+        if args.weights:
+            weights = dict(zip(answers, answer_weights(args)))
+            candidates.sort(key=lambda w: -weights[w])
+    with stats.stage('output'):
+        for c in candidates:
+            print(c)
+    report_stats(stats)
+
+
+def parse_arguments(argv):
+    parser = argparse.ArgumentParser()
+    parser.add_argument('tries', nargs='*',
+                        help='Previous attempts. Format: "words=00112". 0 for grey, 1 for yellow, 2 for green.')
+    parser.add_argument('--backend', choices=['table', 'rules', 'lambda'], default='table',
+                        help='"table" looks tries up in the precomputed pattern table, '
+                             '"rules" checks the merged clues with array operations, '
+                             '"lambda" evaluates the per-clue rules (reference implementation). '
+                             'The rules backends ignore where a grey copy of a letter shown yellow or green '
+                             'elsewhere sits, so they can list a few candidates the table rules out.')
+    parser.add_argument('--top', type=count, default=0, metavar='K',
+                        help='Print the K best next guesses instead of the remaining candidates.')
+    parser.add_argument('--metric', choices=['entropy', 'size'], default='entropy',
+                        help='Rank guesses by expected information or by expected number of candidates left.')
+    parser.add_argument('--hard', action='store_true',
+                        help='Only suggest guesses that satisfy every clue so far, as in hard mode.')
+    parser.add_argument('--lookahead', type=count, default=10, metavar='N',
+                        help='In hard mode, score the N best guesses, and at least K, over two moves. 0 to score '
+                             'single moves only. Default: %(default)s')
+    parser.add_argument('--tree', metavar='PATH', help='Print the next guess from a tree saved by build-tree.')
+    parser.add_argument('--stats', action='store_true',
+                        help='Log the time spent in each stage and how many words were tested to stderr.')
+    add_table_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.tree and (args.top or args.hard or args.backend != 'table'):
+        parser.error('--tree cannot be combined with --top, --hard or --backend')
+    if args.stats:
+        logging.basicConfig(format='%(message)s', level=logging.INFO)
+    try:
+        args.tries = validate_tries(args.tries)
+    except InvalidTry:
+        parser.print_help()
+        sys.exit(1)
+    return args
+
+
+def count(value):
+    """argparse type for a number of things, which cannot be negative."""
+    n = int(value)
+    if n < 0:
+        raise argparse.ArgumentTypeError(f'must not be negative: {value}')
+    return n
+
+
+def add_table_arguments(parser):
+    parser.add_argument('--words', metavar='FILE',
+                        help='Allowed guesses, as a text file of words or a file written by pack-words. '
+                             'Default: the built-in list.')
+    parser.add_argument('--answers', metavar='FILE',
+                        help='Possible answers, in the same formats. Default: the allowed guesses.')
+    parser.add_argument('--weights', metavar='FILE',
+                        help='How likely each answer is, as lines of a word and a weight such as its frequency. '
+                             'Rankings then favour likely answers and candidates are listed most likely first. '
+                             'Unlisted words weigh as much as the lightest listed one.')
+    parser.add_argument('--cache-dir', default=default_cache_dir(),
+                        help='Where to keep the pattern table between runs, one file per pair of word lists '
+                             'readable only by you. Files for lists no longer used can be deleted. '
+                             'Default: %(default)s')
+    parser.add_argument('--no-cache', dest='cache_dir', action='store_const', const=None,
+                        help='Build the pattern table in memory on every run.')
+
+
+def solver(args):
+    return Solver(args.words, args.answers, args.cache_dir, cache=args.cache_dir is not None, weights=args.weights)
+
+
+def word_lists(args):
+    try:
+        return solver(args).word_lists
+    except (OSError, ValueError) as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+
+
+def answer_weights(args):
+    try:
+        return solver(args).weights
+    except (OSError, ValueError) as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+
+
+def open_table(args):
+    try:
+        return solver(args).table
+    except (OSError, ValueError) as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+
+
+def known_opener(parser, table, opener):
+    """The opener in lower case, exiting with a usage error unless it is an allowed guess."""
+    if opener is None:
+        return None
+    opener = opener.lower()
+    if opener not in table.guess_index:
+        parser.error(f'Not in the word list: {opener}')
+    return opener
+
+
+def pack_words_command(argv):
+    parser = argparse.ArgumentParser(prog='wordle-solver.py pack-words',
+                                     description='Convert a word list to the packed format read by --words.')
+    parser.add_argument('input', help='Text file of words, or an already packed file.')
+    parser.add_argument('output')
+    args = parser.parse_args(argv)
+    try:
+        words = read_words(args.input)
+        pack_words(words, args.output)
+    except (OSError, ValueError) as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+    print(f'Packed {len(words)} words into {args.output}')
+
+
+def batch(argv):
+    parser = argparse.ArgumentParser(prog='wordle-solver.py batch',
+                                     description='Solve one game per line, each line being tries like "black=01122 '
+                                                 'white=01122". Prints the tries, the number of candidates and the '
+                                                 'best next guesses, separated by tabs.')
+    parser.add_argument('input', nargs='?', default='-', help='File of games. Default: stdin.')
+    parser.add_argument('--top', type=count, default=1, metavar='K',
+                        help='Guesses to suggest per game, 0 to only count candidates. Default: %(default)s')
+    parser.add_argument('--metric', choices=['entropy', 'size'], default='entropy')
+    parser.add_argument('--cache-size', type=int, default=100_000,
+                        help='Positions whose suggestions are remembered across games. Default: %(default)s')
+    add_table_arguments(parser)
+    args = parser.parse_args(argv)
+
+    table = open_table(args)
+    suggestions = LRUCache(args.cache_size)
+    games = 0
+    start = time.perf_counter()
+    with sys.stdin if args.input == '-' else open(args.input) as f:
+        for line in f:
+            tries = line.lower().split()
+            if not tries:
+                continue
+            games += 1
+            try:
+                validate_tries(tries)
+            except InvalidTry as e:
+                print(f'{" ".join(tries)}\terror\t{e}')
+                continue
+            candidates = table.filter(tries)
+            # Games share positions, most of all early on, so rank each set of candidates once
+            key = hashlib.blake2b(candidates.tobytes(), digest_size=16).digest()
+            best = suggestions.get(key)
+            if best is None and args.top:
+                best = suggestions[key] = [w for w, _ in best_guesses(table, candidates, args.top, args.metric)]
+            print(f'{" ".join(tries)}\t{len(candidates)}\t{",".join(best or [])}')
+    elapsed = time.perf_counter() - start
+    print(f'{games} games in {elapsed:.1f}s ({games / max(elapsed, 1e-9):.0f} games/sec)', file=sys.stderr)
+
+
+def bench(argv):
+    # Unix-only, so kept out of the module for the other commands' sake
+    import resource
+
+    parser = argparse.ArgumentParser(prog='wordle-solver.py bench',
+                                     description='Time the solver on fixed, seeded scenarios and print JSON.')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--games', type=int, default=20, help='Histories per filtering scenario. Default: %(default)s')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per scenario. Default: %(default)s')
+    parser.add_argument('--only', nargs='+', metavar='PREFIX', help='Only run scenarios whose names start with these.')
+    parser.add_argument('--workers', type=int, default=1, help='Processes for the simulation. Default: %(default)s')
+    parser.add_argument('--output', help='Write the JSON here instead of stdout.')
+    add_table_arguments(parser)
+    args = parser.parse_args(argv)
+
+    table_args = ['--no-cache'] if args.cache_dir is None else ['--cache-dir', os.path.abspath(args.cache_dir)]
+    for option in ['words', 'answers', 'weights']:
+        if getattr(args, option):
+            table_args += [f'--{option}', os.path.abspath(getattr(args, option))]
+    table = open_table(args)
+    words = table.answers
+    letters = encode(words)
+    counts = letter_counts(letters)
+    rng = Random(args.seed)
+    everything = np.arange(len(words))
+    first = random_histories(rng, words, 1, 1)[0]
+
+    # Run the package from the directory holding it, wherever the current one is
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    command = [sys.executable, '-m', 'wordle_solver']
+    scenarios = {
+        'startup_import': lambda: subprocess.run([sys.executable, '-c', 'import wordle_solver'], cwd=root),
+        'startup_help': lambda: subprocess.run([*command, '--help'], cwd=root, stdout=subprocess.DEVNULL),
+        'startup_query': lambda: subprocess.run([*command, *table_args, *first], cwd=root,
+                                                stdout=subprocess.DEVNULL),
+        'table_open': lambda: open_table(args),
+    }
+    for n in range(1, 7):
+        histories = random_histories(rng, words, n, args.games)
+        scenarios.update({
+            f'clues_{n}': lambda h=histories: [merge_clues(t) for t in h],
+            f'rules_{n}': lambda h=histories: [[get_rules(le, c) for le, c in merge_clues(t).items()] for t in h],
+            f'filter_lambda_{n}': lambda h=histories: [filter_by_rules(t, words) for t in h],
+            f'filter_compiled_{n}': lambda h=histories: [CompiledRules(merge_clues(t))(letters, counts) for t in h],
+            f'filter_table_{n}': lambda h=histories: [table.filter(t) for t in h],
+        })
+    for n in range(1, 4):
+        histories = worst_histories(rng, table, n, args.games)
+        scenarios[f'filter_worst_{n}'] = lambda h=histories: [table.filter(t) for t in h]
+        scenarios[f'rank_worst_{n}'] = lambda h=histories[:5]: [best_guesses(table, table.filter(t), 10) for t in h]
+    scenarios.update({
+        'rank_first': lambda: best_guesses(table, everything, 10),
+        'rank_second': lambda: best_guesses(table, table.filter(first), 10),
+        'minimax_second': lambda: Minimax(table).depth(table.filter(first)),
+        'simulate': lambda: simulate_games(Strategy(table), everything, args.workers),
+    })
+    # The same table with a heavy-tailed prior, as word frequencies have, drawn apart from rng so
+    # the other scenarios stay the same for a seed
+    prior = Random(args.seed)
+    weighted = copy.copy(table)
+    weighted.weights = np.array([prior.paretovariate(1) for _ in words])
+    scenarios.update({
+        'rank_weighted_first': lambda: best_guesses(weighted, everything, 10),
+        'rank_weighted_second': lambda: best_guesses(weighted, weighted.filter(first), 10),
+    })
+    for boards in [4, 8]:
+        # Every board after the same opening guess, each with its own answer
+        guess = rng.choice(words)
+        boards = [table.filter([f'{guess}={feedback(guess, a)}']) for a in rng.sample(words, boards)]
+        scenarios[f'rank_multi_{len(boards)}'] = lambda b=boards: best_multi_guesses(table, b, 10)
+
+    results = {}
+    for name, run in scenarios.items():
+        if args.only and not name.startswith(tuple(args.only)):
+            continue
+        # Whole-dictionary runs take seconds, so a single run is enough
+        results[name] = measure(run, 1 if name == 'simulate' else args.repeat)
+        print(f'{name}: {results[name]["seconds"] * 1000:.2f} ms', file=sys.stderr)
+
+    report = {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'seed': args.seed,
+        'games': args.games,
+        'guesses': len(table.guesses),
+        'answers': len(table.answers),
+        'scenarios': results,
+        'max_rss_kb': {
+            'self': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+            'children': resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+        },
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+
+def bench_rules(argv):
+    parser = argparse.ArgumentParser(prog='wordle-solver.py bench-rules',
+                                     description='Time the lambda rules against the compiled rules and the table, '
+                                                 'and cross-check the three.')
+    parser.add_argument('--games', type=int, default=200, help='Histories per number of tries. Default: %(default)s')
+    parser.add_argument('--seed', type=int, default=0)
+    add_table_arguments(parser)
+    args = parser.parse_args(argv)
+
+    table = open_table(args)
+    words = table.answers
+    letters = encode(words)
+    counts = letter_counts(letters)
+    rng = Random(args.seed)
+    pairs = [(rng.choice(table.guesses), rng.randrange(len(words))) for _ in range(10 * args.games)]
+    # Explicit checks rather than asserts, which python -O would skip
+    mismatches = [(g, words[a]) for g, a in pairs if pattern_string(table.row(g)[a]) != feedback(g, words[a])]
+    if mismatches:
+        print(f'The table disagrees with feedback() on {len(mismatches)} pairs such as {mismatches[0]}',
+              file=sys.stderr)
+        sys.exit(1)
+    print(f'The table agrees with feedback() on {len(pairs)} random pairs')
+    # The rules never learn that a grey copy of a letter shown yellow or green elsewhere is not at its
+    # own position, so they can keep candidates the table rules out, but never the other way round
+    print('tries  lambda ms  compiled ms  table ms  speedup  same as table')
+    for n in range(1, 6):
+        histories = random_histories(rng, words, n, args.games)
+
+        start = time.perf_counter()
+        expected = [filter_by_rules(tries, words) for tries in histories]
+        lambda_time = (time.perf_counter() - start) / len(histories)
+
+        start = time.perf_counter()
+        masks = [CompiledRules(merge_clues(tries))(letters, counts) for tries in histories]
+        compiled_time = (time.perf_counter() - start) / len(histories)
+
+        start = time.perf_counter()
+        indices = [table.filter(tries) for tries in histories]
+        table_time = (time.perf_counter() - start) / len(histories)
+
+        if not all(e == [words[i] for i in np.flatnonzero(m)] for e, m in zip(expected, masks)):
+            print(f'The compiled rules disagree with the lambda rules after {n} tries', file=sys.stderr)
+            sys.exit(1)
+        if not all(set(np.flatnonzero(m)) >= set(i) for m, i in zip(masks, indices)):
+            print(f'The table keeps candidates the rules rule out after {n} tries', file=sys.stderr)
+            sys.exit(1)
+        same = sum(m.sum() == len(i) for m, i in zip(masks, indices))
+        print(f'{n:5}  {lambda_time * 1000:9.3f}  {compiled_time * 1000:11.3f}  {table_time * 1000:8.3f}  '
+              f'{lambda_time / compiled_time:6.1f}x  {same:6}/{len(histories)}')
+
+
+def simulate(argv):
+    parser = argparse.ArgumentParser(prog='wordle-solver.py simulate',
+                                     description='Play the solver against every word as the answer.')
+    parser.add_argument('--opener', help='First guess. Default: the best-ranked word.')
+    parser.add_argument('--metric', choices=['entropy', 'size'], default='entropy')
+    parser.add_argument('--max-guesses', type=int, default=6,
+                        help='Games needing more guesses count as failures. Default: %(default)s')
+    parser.add_argument('--workers', type=int, help='Processes to use. Default: one per CPU.')
+    add_table_arguments(parser)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    table = open_table(args)
+    strategy = Strategy(table, known_opener(parser, table, args.opener), args.metric)
+    guesses = simulate_games(strategy, range(len(table.answers)), args.workers)
+    elapsed = time.perf_counter() - start
+
+    failures = sum(n > args.max_guesses for n in guesses)
+    print(f'opener {strategy.opener}, {len(guesses)} games in {elapsed:.1f}s')
+    print(f'mean {np.mean(guesses):.3f}, max {max(guesses)}, '
+          f'failures {failures} ({failures / len(guesses):.2%})')
+    histogram = Counter(guesses)
+    for n in range(1, max(guesses) + 1):
+        print(f'{n:3} {histogram[n]:6} {"#" * round(60 * histogram[n] / len(guesses))}')
+
+
+def build_tree_command(argv):
+    parser = argparse.ArgumentParser(prog='wordle-solver.py build-tree',
+                                     description='Save the whole strategy as a tree for answering with --tree.')
+    parser.add_argument('output', help='File to write the tree to.')
+    parser.add_argument('--opener', help='First guess. Default: the best-ranked word.')
+    parser.add_argument('--metric', choices=['entropy', 'size'], default='entropy')
+    parser.add_argument('--workers', type=int, help='Processes to use. Default: one per CPU.')
+    add_table_arguments(parser)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    table = open_table(args)
+    strategy = Strategy(table, known_opener(parser, table, args.opener), args.metric)
+    tree = build_tree_parallel(strategy, args.workers)
+    save_tree(tree, args.output, word_list_digest(table.guesses, table.answers))
+    print(f'Saved the tree from {tree[0]} to {args.output} in {time.perf_counter() - start:.1f}s')
+
+
+def multi(argv):
+    parser = argparse.ArgumentParser(prog='wordle-solver.py multi',
+                                     description='Solve several boards played with the same guesses, '
+                                                 'as in Quordle or Octordle.')
+    parser.add_argument('tries', nargs='*',
+                        help='Previous attempts, with one pattern per board. Format: "words=00112,00000,...". '
+                             'Patterns for boards already solved are ignored.')
+    parser.add_argument('--boards', type=int, metavar='N',
+                        help='Number of boards. Default: the number of patterns in each try, or 4.')
+    parser.add_argument('--top', type=count, default=5, metavar='K',
+                        help='Best next guesses to print. Default: %(default)s')
+    parser.add_argument('--metric', choices=['entropy', 'size'], default='entropy')
+    parser.add_argument('--limit', type=count, default=10,
+                        help='Candidates to print per board. Default: %(default)s')
+    add_table_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.boards is not None and args.boards < 1:
+        parser.error(f'Invalid number of boards: {args.boards}')
+    try:
+        tries = validate_multi_tries(args.tries, args.boards)
+    except InvalidTry as e:
+        parser.error(str(e))
+    if args.boards is None:
+        boards = len(tries[0].split(',')) if tries else 4
+    else:
+        boards = args.boards
+
+    session = MultiSession(open_table(args), boards)
+    for attempt in tries:
+        session.add(attempt)
+    table = session.table
+    for i, candidates in enumerate(session.candidates):
+        if session.solved(i):
+            print(f'board {i + 1}: solved')
+        else:
+            words = ' '.join(table.answers[c] for c in table.by_weight(candidates)[:args.limit])
+            print(f'board {i + 1}: {len(candidates)} left {words}{" ..." if len(candidates) > args.limit else ""}')
+    if args.top:
+        unsolved = [session.candidates[i] for i in session.unsolved()]
+        for word, score in best_multi_guesses(table, unsolved, args.top, args.metric):
+            print(f'{word} {score:.3f}')
+
+
+def worst_case(argv):
+    parser = argparse.ArgumentParser(prog='wordle-solver.py worst-case',
+                                     description='Find how many guesses each opener needs in the worst case, '
+                                                 'searching the guesses that leave the smallest partitions.')
+    parser.add_argument('--opener', action='append', help='First guess to analyze. Can be given more than once.')
+    parser.add_argument('--openers', type=int, default=1, metavar='N',
+                        help='Without --opener, analyze the N guesses leaving the smallest largest partition. '
+                             'Default: %(default)s')
+    parser.add_argument('--breadth', type=int, default=10, metavar='N',
+                        help='Guesses to try at each position. More is slower but can only lower the result, '
+                             'which is otherwise an upper bound. Default: %(default)s')
+    parser.add_argument('--memo-size', type=int, default=1_000_000,
+                        help='Positions to remember. Default: %(default)s')
+    parser.add_argument('--workers', type=int, help='Processes to use. Default: one per CPU.')
+    parser.add_argument('--answers-out', metavar='FILE',
+                        help='Write the guesses needed for each answer after each opener to this file.')
+    add_table_arguments(parser)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    table = open_table(args)
+    if args.opener:
+        openers = [table.guess_index[known_opener(parser, table, w)] for w in args.opener]
+    else:
+        openers = minimax_openers(table, args.openers)
+    reports = analyze_openers(Minimax(table, args.breadth, args.memo_size), openers,
+                              args.answers_out is not None, args.workers)
+
+    for report in reports:
+        code, size = report['partition']
+        path = ' '.join(f'{guess}={pattern_string(c)}' for guess, c in report['path'])
+        print(f'{report["opener"]}: at most {report["depth"]} guesses, '
+              f'worst after {pattern_string(code)} ({size} words): {path}')
+    print(f'{len(reports)} openers in {time.perf_counter() - start:.1f}s', file=sys.stderr)
+    if args.answers_out:
+        with open(args.answers_out, 'w') as f:
+            for report in reports:
+                for answer, n in sorted(report['answers'].items()):
+                    f.write(f'{report["opener"]}\t{table.answers[answer]}\t{n}\n')
+
+
+def serve(argv):
+    parser = argparse.ArgumentParser(prog='wordle-solver.py serve',
+                                     description='Answer newline-delimited JSON requests with the candidates '
+                                                 'and best guesses for each history of tries.')
+    parser.add_argument('--socket', metavar='PATH', help='Listen on a Unix socket instead of reading stdin.')
+    parser.add_argument('--metric', choices=['entropy', 'size'], default='entropy')
+    add_table_arguments(parser)
+    args = parser.parse_args(argv)
+
+    service = SolverService(open_table(args), args.metric)
+    try:
+        asyncio.run(service.serve_socket(args.socket) if args.socket else service.serve_stdin())
+    except KeyboardInterrupt:
+        pass
+    except OSError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+
+
+commands = {
+    'batch': batch,
+    'bench': bench,
+    'build-tree': build_tree_command,
+    'multi': multi,
+    'pack-words': pack_words_command,
+    'bench-rules': bench_rules,
+    'serve': serve,
+    'simulate': simulate,
+    'worst-case': worst_case,
+}
@@ -0,0 +1,121 @@
+from collections import defaultdict
+
+import numpy as np
+
+from .stats import NO_STATS
+
+
+def merge_clues(tries, stats=None):
+    stats = stats or NO_STATS
+    with stats.stage('clues'):
+        clues = [get_clues(attempt) for attempt in tries]
+    with stats.stage('merge'):
+        global_clues = defaultdict(Clue)
+        for new_clues in clues:
+            for letter, new_clue in new_clues.items():
+                global_clues[letter] += new_clue
+    return global_clues
+
+
+def filter_by_rules(tries, words, stats=None):
+    stats = stats or NO_STATS
+    rules = []
+    global_clues = merge_clues(tries, stats)
+    with stats.stage('rules'):
+        for letter, clue in global_clues.items():
+            rules += get_rules(letter, clue)
+    with stats.stage('filter'):
+        result = [w for w in words if all(r(w) for r in rules)]
+    stats.add('rules', len(rules))
+    stats.add('tested', len(words))
+    stats.add('survivors', len(result))
+    return result
+
+
+def get_clues(attempt: str):
+    word, outputs = attempt.split('=')
+    result = defaultdict(Clue)
+    for i, (letter, output) in enumerate(zip(word, outputs)):
+        if output == '0':
+            result[letter].may_have_more = False
+        else:
+            result[letter].min_occurrence += 1
+            if output == '1':
+                result[letter].must_not_be_at.append(i)
+            else:
+                result[letter].must_be_at.append(i)
+    return result
+
+
+def get_rules(letter, clue):
+    result = [lambda x, le=letter, p=p: x[p] == le for p in clue.must_be_at]
+    result += [lambda x, le=letter, p=p: x[p] != le for p in clue.must_not_be_at]
+    if clue.may_have_more:
+        result.append(lambda x, l=letter, c=clue.min_occurrence: x.count(l) >= c)
+    else:
+        result.append(lambda x, l=letter, c=clue.min_occurrence: x.count(l) == c)
+    return result
+
+
+class Clue:
+    def __init__(self):
+        self.min_occurrence = 0
+        self.may_have_more = True
+        self.must_be_at = []
+        self.must_not_be_at = []
+
+    def __add__(self, other):
+        result = Clue()
+        result.min_occurrence = max(self.min_occurrence, other.min_occurrence)
+        result.may_have_more = all([self.may_have_more, other.may_have_more])
+        result.must_be_at = self.must_be_at + other.must_be_at
+        result.must_not_be_at = self.must_not_be_at + other.must_not_be_at
+        return result
+
+
+class CompiledRules:
+    """
+    The rules from a set of merged clues as array checks: a bitmask of allowed letters per
+    position and bounds on how often each clued letter occurs.
+
+    Calling it with the encoded words and their letter_counts gives a boolean mask of the
+    words that pass every rule, same as get_rules would.
+    """
+
+    def __init__(self, clues):
+        self.allowed = np.full(5, (1 << 26) - 1, dtype=np.int32)
+        self.letters = np.array([ord(letter) - ord('a') for letter in clues], dtype=np.intp)
+        self.min_count = np.array([clue.min_occurrence for clue in clues.values()], dtype=np.int8)
+        self.max_count = np.array([5 if clue.may_have_more else clue.min_occurrence for clue in clues.values()],
+                                  dtype=np.int8)
+        for letter, clue in zip(self.letters, clues.values()):
+            for p in clue.must_be_at:
+                self.allowed[p] &= 1 << letter
+            for p in clue.must_not_be_at:
+                self.allowed[p] &= ~(1 << letter)
+
+    def __len__(self):
+        """The number of checks: positions ruling out some letter, plus letters with count bounds."""
+        restricted = (self.allowed != (1 << 26) - 1).sum()
+        bounded = ((self.min_count > 0) | (self.max_count < 5)).sum()
+        return int(restricted + bounded)
+
+    def __call__(self, letters, counts):
+        result = ((self.allowed >> letters) & 1).all(axis=1)
+        if len(self.letters):
+            clued = counts[:, self.letters]
+            result &= ((clued >= self.min_count) & (clued <= self.max_count)).all(axis=1)
+        return result
+
+
+def encode(words):
+    if getattr(words, 'letters', None) is not None:
+        return words.letters
+    return np.frombuffer(''.join(words).encode('ascii'), dtype=np.uint8).reshape(-1, 5) - ord('a')
+
+
+def letter_counts(letters):
+    result = np.zeros((len(letters), 26), dtype=np.int8)
+    for i in range(5):
+        np.add.at(result, (np.arange(len(letters)), letters[:, i]), 1)
+    return result
@@ -0,0 +1,42 @@
+import re
+
+ALL_GREEN = int('22222', 3)
+TRY_PATTERN = re.compile('^[a-z]{5}=[0-2]{5}$')
+
+
+class InvalidTry(ValueError):
+    pass
+
+
+def validate_tries(tries):
+    """The tries in lower case, or InvalidTry if any is not like "black=01122"."""
+    if not isinstance(tries, (list, tuple)) or not all(isinstance(t, str) for t in tries):
+        raise InvalidTry('Tries must be a list of strings')
+    tries = [t.lower() for t in tries]
+    invalid = [t for t in tries if not TRY_PATTERN.match(t)]
+    if invalid:
+        raise InvalidTry(f'Invalid tries: {", ".join(invalid)}')
+    return tries
+
+
+def feedback(guess, answer):
+    result = ['0'] * 5
+    left = []
+    for i, (g, a) in enumerate(zip(guess, answer)):
+        if g == a:
+            result[i] = '2'
+        else:
+            left.append(a)
+    for i, g in enumerate(guess):
+        if result[i] == '0' and g in left:
+            result[i] = '1'
+            left.remove(g)
+    return ''.join(result)
+
+
+def pattern_string(code):
+    digits = ''
+    for _ in range(5):
+        code, digit = divmod(int(code), 3)
+        digits = str(digit) + digits
+    return digits
@@ -0,0 +1,177 @@
+import hashlib
+
+import numpy as np
+
+from .game import ALL_GREEN
+from .ranking import score_guesses
+from .session import LRUCache
+from .strategy import worker_count, worker_pool, worker_state
+
+MAX_DEPTH = 20
+
+
+class Minimax:
+    """
+    Worst-case number of guesses needed to solve any set of candidate answers.
+
+    At each position only the breadth guesses leaving the smallest largest partition are
+    tried, so the result is the exact minimax over that restricted play and an upper bound
+    on the true one: the strategy found always finishes within it.
+
+    Positions are remembered by a hash of their candidates in an LRU table of memo_size
+    entries. A guess is abandoned as soon as one of its partitions needs as many guesses as
+    the best guess found so far, and the search of that partition stops there too.
+    """
+
+    def __init__(self, table, breadth=10, memo_size=1_000_000):
+        self.table = table
+        self.breadth = breadth
+        self.memo = LRUCache(memo_size)
+
+    def depth(self, candidates):
+        """Guesses needed in the worst case, counting the one that shows all greens."""
+        return self.search(candidates, MAX_DEPTH)[0]
+
+    def search(self, candidates, limit):
+        """
+        The worst-case number of guesses and the guess index achieving it, if fewer than limit.
+
+        Otherwise (a lower bound of at least limit, None).
+        """
+        n = len(candidates)
+        if n <= 2:
+            return n, self.table.answer_guesses[candidates[0]]
+        key = hashlib.blake2b(candidates.tobytes(), digest_size=16).digest()
+        value, guess = self.memo.get(key, (0, None))
+        if guess is not None or value >= limit:
+            return value, guess
+
+        worst = score_guesses(self.table, candidates, 'worst')
+        answers = self.table.answer_guesses[candidates]
+        answers = answers[answers >= 0]
+        # A guess leaving only single words finds the answer next, and a candidate doing so may find it now
+        if worst.min() == 1:
+            value, guess = 2, answers[worst[answers] == 1][0] if (worst[answers] == 1).any() else np.argmin(worst)
+        elif limit <= 3:
+            value, guess = 3, None
+        else:
+            possible = np.zeros(len(worst), dtype=bool)
+            possible[answers] = True
+            order = np.lexsort((~possible, worst))[:self.breadth]
+            value = limit
+            for g in order[worst[order] < n]:
+                depth = self.evaluate(g, candidates, value)
+                if depth < value:
+                    value, guess = depth, g
+                    # Nothing does better than 3 once 2 is ruled out
+                    if value == 3:
+                        break
+        self.memo[key] = value, guess
+        return value, guess
+
+    def evaluate(self, guess, candidates, limit):
+        """Worst case after the guess index, or at least limit once it is certain to reach it."""
+        codes = self.table.patterns[guess][candidates]
+        values, sizes = np.unique(codes, return_counts=True)
+        worst = 1
+        # The largest partitions are the likeliest to reach the limit, so they go first
+        for code in values[np.argsort(-sizes, kind='stable')]:
+            if code != ALL_GREEN:
+                worst = max(worst, 1 + self.search(candidates[codes == code], limit - 1)[0])
+                if worst >= limit:
+                    break
+        return worst
+
+    def worst_path(self, candidates, history=()):
+        """A history of (guess, pattern code) pairs needing the most guesses, ending with all greens."""
+        history = list(history)
+        while True:
+            guess = self.search(candidates, MAX_DEPTH)[1]
+            codes = self.table.patterns[guess][candidates]
+            if len(candidates) == 1:
+                return history + [(self.table.guesses[guess], ALL_GREEN)]
+            worst = max((self.depth(candidates[codes == c]), int(c)) for c in np.unique(codes) if c != ALL_GREEN)
+            history.append((self.table.guesses[guess], worst[1]))
+            candidates = candidates[codes == worst[1]]
+
+    def guesses_needed(self, candidates):
+        """Number of guesses the strategy takes for each of the candidates."""
+        if len(candidates) == 1:
+            return {int(candidates[0]): 1}
+        guess = self.search(candidates, MAX_DEPTH)[1]
+        codes = self.table.patterns[guess][candidates]
+        result = {}
+        for code in np.unique(codes):
+            if code == ALL_GREEN:
+                result[int(candidates[codes == code][0])] = 1
+            else:
+                for answer, n in self.guesses_needed(candidates[codes == code]).items():
+                    result[answer] = n + 1
+        return result
+
+
+def _analyze_partition(minimax, task):
+    opener, code, answers = task
+    candidates = np.flatnonzero(minimax.table.patterns[opener] == code)
+    history = [(minimax.table.guesses[opener], code)]
+    result = {
+        'depth': 1 + minimax.depth(candidates),
+        'path': minimax.worst_path(candidates, history),
+    }
+    if answers:
+        result['answers'] = {a: n + 1 for a, n in minimax.guesses_needed(candidates).items()}
+    return result
+
+
+def _analyze_in_worker(task):
+    return _analyze_partition(worker_state(), task)
+
+
+def analyze_openers(minimax, openers, answers=False, workers=None):
+    """
+    The worst case after each opener index, as dicts with the worst-case "depth", the
+    "partition" after the opener that needs the most guesses (pattern code and size) and a
+    "path" of (guess, pattern code) pairs through it.
+
+    With answers, "answers" also maps each answer index to the guesses the strategy takes for it.
+    The partitions left by the openers are searched across processes, the biggest first.
+    """
+    table = minimax.table
+    tasks = []
+    for opener in openers:
+        codes, sizes = np.unique(table.patterns[opener], return_counts=True)
+        tasks += [(opener, int(c), answers, s) for c, s in zip(codes, sizes) if c != ALL_GREEN]
+    tasks.sort(key=lambda task: -task[3])
+    tasks = [task[:3] for task in tasks]
+
+    workers = worker_count(workers)
+    if workers == 1:
+        results = [_analyze_partition(minimax, task) for task in tasks]
+    else:
+        with worker_pool(minimax, workers) as executor:
+            results = list(executor.map(_analyze_in_worker, tasks, chunksize=1))
+
+    reports = []
+    for opener in openers:
+        partitions = {task[1]: result for task, result in zip(tasks, results) if task[0] == opener}
+        codes, sizes = np.unique(table.patterns[opener], return_counts=True)
+        sizes = dict(zip(codes.tolist(), sizes.tolist()))
+        worst = max(partitions, key=lambda code: (partitions[code]['depth'], sizes[code]))
+        report = {
+            'opener': table.guesses[opener],
+            'depth': partitions[worst]['depth'],
+            'partition': (worst, sizes[worst]),
+            'path': partitions[worst]['path'],
+        }
+        if answers:
+            report['answers'] = {int(a): 1 for a in np.flatnonzero(table.answer_guesses == opener)}
+            for result in partitions.values():
+                report['answers'].update(result['answers'])
+        reports.append(report)
+    return reports
+
+
+def minimax_openers(table, count=1):
+    """The count guess indices leaving the smallest largest partition of all the answers."""
+    worst = score_guesses(table, np.arange(len(table.answers)), 'worst')
+    return list(np.argsort(worst, kind='stable')[:count])
@@ -0,0 +1,104 @@
+import re
+
+import numpy as np
+
+from .game import ALL_GREEN, InvalidTry
+from .ranking import score_guesses
+from .session import SolverSession
+
+MULTI_TRY_PATTERN = re.compile('^[a-z]{5}=[0-2]{5}(,[0-2]{5})*$')
+
+
+def validate_multi_tries(tries, boards=None):
+    """
+    The tries in lower case, or InvalidTry if any is not like "black=01122,00000,...".
+
+    Each try has one pattern per board, and every try must have boards of them (by default,
+    as many as the first try).
+    """
+    tries = [t.lower() for t in tries]
+    invalid = [t for t in tries if not MULTI_TRY_PATTERN.match(t)]
+    if invalid:
+        raise InvalidTry(f'Invalid tries: {", ".join(invalid)}')
+    if tries and boards is None:
+        boards = len(split_multi_try(tries[0]))
+    invalid = [t for t in tries if len(split_multi_try(t)) != boards]
+    if invalid:
+        raise InvalidTry(f'Tries without one pattern for each of the {boards} boards: {", ".join(invalid)}')
+    return tries
+
+
+def split_multi_try(attempt):
+    """The try for each board, like ["black=01122", "black=00000"] for "black=01122,00000"."""
+    word, outputs = attempt.split('=')
+    return [f'{word}={pattern}' for pattern in outputs.split(',')]
+
+
+class MultiSession:
+    """
+    Several boards played with the same guesses, as in Quordle (4 boards) or Octordle (8).
+
+    Each board keeps its own candidates but all of them index one shared PatternTable. Once a
+    board shows all greens it is solved, and patterns given for it afterwards are ignored.
+    """
+
+    def __init__(self, table, boards):
+        self.table = table
+        self.boards = [SolverSession(table) for _ in range(boards)]
+        self.tries = []
+        self._added = []
+
+    @property
+    def candidates(self):
+        return [board.candidates for board in self.boards]
+
+    def solved(self, board):
+        tries = self.boards[board].tries
+        return bool(tries) and int(tries[-1].split('=')[1], 3) == ALL_GREEN
+
+    def unsolved(self):
+        return [i for i in range(len(self.boards)) if not self.solved(i)]
+
+    def add(self, attempt):
+        attempt, = validate_multi_tries([attempt], len(self.boards))
+        singles = split_multi_try(attempt)
+        added = self.unsolved()
+        for i in added:
+            self.boards[i].add(singles[i])
+        self.tries.append(attempt)
+        self._added.append(added)
+
+    def undo(self):
+        if not self.tries:
+            raise IndexError('No try to undo')
+        for i in self._added.pop():
+            self.boards[i].undo()
+        return self.tries.pop()
+
+
+def best_multi_guesses(table, candidate_sets, top=10, metric='entropy'):
+    """
+    Best next guesses for several boards at once, as (word, score) pairs.
+
+    A guess scores the sum of its best_guesses scores on each board: the total information
+    in bits, or the total number of candidates expected to be left. Boards with the same
+    candidates, such as every board before the first try, are only scored once. Ties go to
+    guesses that could be the answer on more boards.
+    """
+    candidate_sets = [c for c in candidate_sets if len(c)]
+    if not candidate_sets:
+        return []
+
+    totals = np.zeros(len(table.guesses))
+    possible = np.zeros(len(table.guesses), dtype=np.intp)
+    scores = {}
+    for candidates in candidate_sets:
+        key = candidates.tobytes()
+        if key not in scores:
+            scores[key] = score_guesses(table, candidates, metric)
+        totals += scores[key]
+        answers = table.answer_guesses[candidates]
+        possible[answers[answers >= 0]] += 1
+    key = -totals if metric == 'entropy' else totals
+    best = np.lexsort((-possible, key))[:top]
+    return [(table.guesses[i], float(totals[i])) for i in best]
@@ -0,0 +1,150 @@
+import numpy as np
+
+from .clues import CompiledRules, get_clues, merge_clues
+from .game import pattern_string
+
+
+def best_guesses(table, candidates, top=10, metric='entropy', pool=None):
+    """
+    Best next guesses for the given candidate indices, as (word, score) pairs.
+
+    "entropy" is the expected information in bits (higher is better), "size" the expected
+    number of candidates left afterwards (lower is better). Ties go to possible answers.
+    A pool of guess indices limits which guesses are considered.
+    """
+    n = len(candidates)
+    if n <= 1:
+        return [(table.answers[i], 0.0) for i in candidates]
+
+    scores = score_guesses(table, candidates, metric, pool)
+    guesses = np.arange(len(table.guesses)) if pool is None else np.asarray(pool)
+    possible = np.zeros(len(table.guesses), dtype=bool)
+    answers = table.answer_guesses[candidates]
+    possible[answers[answers >= 0]] = True
+    key = -scores if metric == 'entropy' else scores
+    best = np.lexsort((~possible[guesses], key))[:top]
+    return [(table.guesses[guesses[i]], float(scores[i])) for i in best]
+
+
+def score_guesses(table, candidates, metric='entropy', pool=None, block_size=64):
+    """
+    The best_guesses score of every guess, or of the guesses in pool, for a non-empty set of candidates.
+
+    Besides "entropy" and "size", "worst" gives the size of the largest partition a guess leaves.
+    With table weights, "entropy" and "size" take each candidate as likely as its weight.
+    """
+    n = len(candidates)
+    patterns = table.patterns if pool is None else table.patterns[pool]
+    entropy = metric == 'entropy'
+    worst = metric == 'worst'
+    if table.weights is not None and not worst:
+        return weighted_scores(patterns, candidates, table.weights[candidates], entropy,
+                               n == len(table.answers), block_size)
+    if n <= 32:
+        # With few candidates, counting each candidate's partition directly beats bincount
+        codes = patterns[:, candidates]
+        sizes = (codes[:, :, None] == codes[:, None, :]).sum(axis=2)
+        if worst:
+            return sizes.max(axis=1)
+        totals = (np.log2(sizes) if entropy else sizes).sum(axis=1)
+    else:
+        # Gather the candidates' columns up front unless that copy gets bigger than the blocks need
+        columns = patterns if n == len(table.answers) else None
+        if columns is None and n <= 1024:
+            columns = patterns[:, candidates]
+        sizes = np.arange(n + 1)
+        cost = sizes * np.log2(np.maximum(sizes, 1)) if entropy else sizes * sizes
+        row_offsets = 243 * np.arange(block_size)[:, None]
+        totals = np.empty(len(patterns), dtype=np.intp if worst else float)
+        for start in range(0, len(patterns), block_size):
+            # Small blocks keep the bincount bins in cache
+            if columns is None:
+                codes = patterns[start:start + block_size, candidates]
+            else:
+                codes = columns[start:start + block_size]
+            offsets = codes + row_offsets[:len(codes)]
+            sizes = np.bincount(offsets.ravel(), minlength=243 * len(codes))
+            if worst:
+                totals[start:start + len(codes)] = sizes.reshape(-1, 243).max(axis=1)
+            else:
+                totals[start:start + len(codes)] = cost[sizes].reshape(-1, 243).sum(axis=1)
+        if worst:
+            return totals
+    return np.log2(n) - totals / n if entropy else totals / n
+
+
+def weighted_scores(patterns, candidates, weights, entropy, everything, block_size=64):
+    """
+    score_guesses with candidates weighted: the information expected under the weights, or
+    the number of candidates expected to be left when the answer is drawn by weight.
+    """
+    total = weights.sum()
+    if len(candidates) <= 32:
+        codes = patterns[:, candidates]
+        same = codes[:, :, None] == codes[:, None, :]
+        # The weight of the partition each candidate ends up in
+        masses = same @ weights
+        totals = (np.log2(masses) if entropy else same.sum(axis=2)) @ weights
+    else:
+        columns = patterns if everything else None
+        if columns is None and len(candidates) <= 1024:
+            columns = patterns[:, candidates]
+        row_offsets = 243 * np.arange(block_size)[:, None]
+        block_weights = np.tile(weights, block_size)
+        totals = np.empty(len(patterns))
+        for start in range(0, len(patterns), block_size):
+            if columns is None:
+                codes = patterns[start:start + block_size, candidates]
+            else:
+                codes = columns[start:start + block_size]
+            offsets = (codes + row_offsets[:len(codes)]).ravel()
+            masses = np.bincount(offsets, block_weights[:len(offsets)], minlength=243 * len(codes))
+            if entropy:
+                costs = masses * np.log2(np.maximum(masses, np.finfo(float).tiny))
+            else:
+                costs = masses * np.bincount(offsets, minlength=243 * len(codes))
+            totals[start:start + len(codes)] = costs.reshape(-1, 243).sum(axis=1)
+    return np.log2(total) - totals / total if entropy else totals / total
+
+
+def hard_mode_pool(table, clues):
+    """Indices of the guesses that satisfy every clue, which is all hard mode allows."""
+    return np.flatnonzero(CompiledRules(clues)(table.guess_letters, table.guess_counts))
+
+
+def best_hard_guesses(table, tries, candidates, top=10, metric='entropy', breadth=10):
+    """
+    Best hard-mode guesses, with the breadth best single-move guesses scored over two moves.
+
+    A guess's second move is limited to the pool its own feedback leaves. With "entropy" the
+    score is the information expected from both moves, with "size" the number of candidates
+    expected after both. A breadth of 0 ranks single moves only, and otherwise at least top
+    guesses are scored over two moves so that every one returned has the same kind of score.
+    """
+    allowed = hard_mode_pool(table, merge_clues(tries))
+    breadth = max(breadth, top) if breadth else 0
+    ranked = best_guesses(table, candidates, max(top, breadth), metric, allowed)
+    if not breadth or len(candidates) <= 2:
+        return ranked[:top]
+
+    entropy = metric == 'entropy'
+    weights = np.ones(len(table.answers)) if table.weights is None else table.weights
+    total = weights[candidates].sum()
+    results = []
+    for guess, score in ranked[:breadth]:
+        codes = table.row(guess)[candidates]
+        follow = 0.0
+        for code in np.unique(codes):
+            subset = candidates[codes == code]
+            share = weights[subset].sum() / total
+            if len(subset) == 1:
+                follow += 0.0 if entropy else share
+                continue
+            # The next pool only needs checking against the new clues
+            clues = get_clues(f'{guess}={pattern_string(code)}')
+            pool = allowed[CompiledRules(clues)(table.guess_letters[allowed], table.guess_counts[allowed])]
+            scores = score_guesses(table, subset, metric, pool)
+            follow += share * (scores.max() if entropy else scores.min())
+        results.append((guess, float(score + follow if entropy else follow)))
+    results.sort(key=lambda result: -result[1] if entropy else result[1])
+    return results[:top]
@@ -0,0 +1,118 @@
+import asyncio
+import json
+import os
+import socket
+import stat
+import sys
+
+from .game import validate_tries
+from .ranking import best_guesses
+from .session import SolverSession
+
+
+class SolverService:
+    """
+    Answers JSON requests against one resident table.
+
+    A request looks like {"id": 1, "tries": ["black=01122"], "top": 5, "limit": 100} and gets
+    {"id": 1, "count": ..., "candidates": [...], "suggestions": [[word, score], ...]} back,
+    or {"id": 1, "error": "..."}. Only "tries" is required.
+
+    With a "session" name the tries are added to that session instead, after taking back
+    the last "undo" tries, and the session lives as long as the connection.
+    """
+
+    def __init__(self, table, metric='entropy'):
+        self.table = table
+        self.metric = metric
+
+    def handle(self, request, sessions=None):
+        try:
+            # Check the whole request before a session changes, so a bad one leaves it as it was
+            tries = validate_tries(request.get('tries', []))
+            limit = int(request.get('limit', 100))
+            top = int(request.get('top') or 0)
+            undo = int(request.get('undo', 0))
+            for name, value in [('limit', limit), ('top', top), ('undo', undo)]:
+                if value < 0:
+                    raise ValueError(f'Invalid {name}: {value}')
+            if 'session' in request and sessions is not None:
+                session = sessions.get(request['session']) or SolverSession(self.table)
+                if undo > len(session.tries):
+                    raise IndexError(f'Only {len(session.tries)} tries to undo')
+                for _ in range(undo):
+                    session.undo()
+                for attempt in tries:
+                    session.add(attempt)
+                sessions[request['session']] = session
+                candidates = session.candidates
+            elif 'tries' in request:
+                candidates = self.table.filter(tries)
+            else:
+                raise ValueError('Missing "tries"')
+            response = {
+                'count': len(candidates),
+                'candidates': [self.table.answers[i] for i in self.table.by_weight(candidates)[:limit]],
+            }
+            if top:
+                response['suggestions'] = best_guesses(self.table, candidates, top, self.metric)
+        except Exception as e:
+            # Whatever a request gets wrong, the other requests and sessions carry on
+            response = {'error': str(e)}
+        if 'id' in request:
+            response['id'] = request['id']
+        return response
+
+    async def handle_line(self, line, sessions):
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            return {'error': f'Invalid JSON: {e}'}
+        if not isinstance(request, dict):
+            return {'error': 'A request must be a JSON object'}
+        # Ranking can take a while, so keep it off the event loop and let other sessions proceed
+        return await asyncio.get_running_loop().run_in_executor(None, self.handle, request, sessions)
+
+    async def serve_stream(self, reader, writer):
+        sessions = {}
+        try:
+            while line := await reader.readline():
+                if line.strip():
+                    writer.write(json.dumps(await self.handle_line(line, sessions)).encode() + b'\n')
+                    await writer.drain()
+        finally:
+            writer.close()
+
+    async def serve_stdin(self):
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader()
+        try:
+            await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+            readline = reader.readline
+        except ValueError:
+            # The event loop only watches pipes, sockets and terminals, so a redirected file is read in a thread
+            def readline():
+                return loop.run_in_executor(None, sys.stdin.buffer.readline)
+        sessions = {}
+        while line := await readline():
+            if line.strip():
+                print(json.dumps(await self.handle_line(line, sessions)), flush=True)
+
+    async def serve_socket(self, path):
+        if os.path.exists(path):
+            # A socket left by an earlier run is replaced, anything else is left alone
+            if not stat.S_ISSOCK(os.stat(path).st_mode):
+                raise FileExistsError(f'{path} exists and is not a socket')
+            with socket.socket(socket.AF_UNIX) as probe:
+                try:
+                    probe.connect(path)
+                except OSError:
+                    os.remove(path)
+                else:
+                    raise FileExistsError(f'A server is already listening on {path}')
+        server = await asyncio.start_unix_server(self.serve_stream, path)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            os.remove(path)
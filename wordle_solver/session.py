@@ -0,0 +1,54 @@
+from collections import OrderedDict
+
+import numpy as np
+
+from .game import validate_tries
+
+
+class SolverSession:
+    """
+    Candidates left after a growing list of tries.
+
+    Adding a try only tests the current survivors, and each step's survivors are kept on a
+    stack so the last tries can be taken back without filtering again.
+    """
+
+    def __init__(self, table):
+        self.table = table
+        self.tries = []
+        self._survivors = [np.arange(len(table.answers))]
+
+    @property
+    def candidates(self):
+        return self._survivors[-1]
+
+    def add(self, attempt):
+        attempt, = validate_tries([attempt])
+        self._survivors.append(self.table.filter([attempt], self.candidates))
+        self.tries.append(attempt)
+
+    def undo(self):
+        if not self.tries:
+            raise IndexError('No try to undo')
+        self._survivors.pop()
+        return self.tries.pop()
+
+
+class LRUCache:
+    """A dict that forgets the least recently used entries beyond maxsize."""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.data = OrderedDict()
+
+    def get(self, key, default=None):
+        if key not in self.data:
+            return default
+        self.data.move_to_end(key)
+        return self.data[key]
+
+    def __setitem__(self, key, value):
+        self.data[key] = value
+        self.data.move_to_end(key)
+        if len(self.data) > self.maxsize:
+            self.data.popitem(last=False)
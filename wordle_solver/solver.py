@@ -0,0 +1,112 @@
+from functools import cached_property, lru_cache
+
+from .game import validate_tries
+from .multi import MultiSession
+from .ranking import best_guesses, best_hard_guesses
+from .session import SolverSession
+from .stats import NO_STATS, report_stats, Stats, stats_hooks
+from .table import default_cache_dir, PatternTable
+from .words import weight_array, word_lists
+
+METRICS = ('entropy', 'size')
+
+
+class Solver:
+    """
+    Candidates and suggestions for histories of tries like "black=01122".
+
+    words and answers are lists of words or paths for read_words, defaulting to the built-in
+    list. Nothing is read until the first question, and the pattern table is kept in cache_dir
+    (the user cache by default) unless cache is False.
+
+    weights, a dict of words to weights such as frequencies or a path for read_weights, makes
+    rankings favour likely answers and lists candidates most likely first.
+
+    candidates and rank fill in a Stats passed as stats, and report it like a command line
+    solve, which also calls stats_hooks.
+
+    Bad tries raise InvalidTry, unreadable word lists OSError or ValueError.
+    """
+
+    def __init__(self, words=None, answers=None, cache_dir=None, cache=True, weights=None):
+        self.words = words
+        self.answers = answers
+        self.weight_source = weights
+        self.cache_dir = (cache_dir or default_cache_dir()) if cache else None
+
+    @cached_property
+    def word_lists(self):
+        return word_lists(self.words, self.answers)
+
+    @cached_property
+    def weights(self):
+        """Weights aligned with the answers, or None."""
+        if self.weight_source is None:
+            return None
+        return weight_array(self.weight_source, self.word_lists[1])
+
+    @cached_property
+    def table(self):
+        return PatternTable(*self.word_lists, self.cache_dir, self.weights)
+
+    def candidates(self, tries, stats=None):
+        """The answers still possible after the tries, the most likely first with weights."""
+        stats = self._stats(stats)
+        indices = self._filter(tries, stats)[1]
+        result = [self.table.answers[i] for i in self.table.by_weight(indices)]
+        report_stats(stats)
+        return result
+
+    def rank(self, tries, top=10, metric='entropy', hard=False, lookahead=10, stats=None):
+        """
+        The top best next guesses after the tries, as (word, score) pairs.
+
+        See best_guesses for the metrics. In hard mode the guesses satisfy every clue so far
+        and the lookahead best ones, at least top, are scored over two moves.
+        """
+        if metric not in METRICS:
+            raise ValueError(f'Unknown metric: {metric}')
+        stats = self._stats(stats)
+        tries, candidates = self._filter(tries, stats)
+        with stats.stage('rank'):
+            if hard:
+                result = best_hard_guesses(self.table, tries, candidates, top, metric, lookahead)
+            else:
+                result = best_guesses(self.table, candidates, top, metric)
+        report_stats(stats)
+        return result
+
+    @staticmethod
+    def _stats(stats):
+        # Like a command line solve, collect stats when asked to or when a hook wants them
+        if stats is None:
+            return Stats() if stats_hooks else NO_STATS
+        return stats
+
+    def _filter(self, tries, stats):
+        with stats.stage('parse'):
+            tries = validate_tries(tries)
+        stats.add('tries', len(tries))
+        with stats.stage('load'):
+            table = self.table
+        with stats.stage('filter'):
+            return tries, table.filter(tries, stats=stats)
+
+    def session(self):
+        return SolverSession(self.table)
+
+    def multi_session(self, boards=4):
+        return MultiSession(self.table, boards)
+
+
+@lru_cache(maxsize=None)
+def default_solver():
+    return Solver()
+
+
+def filter_candidates(tries, solver=None):
+    return (solver or default_solver()).candidates(tries)
+
+
+def rank_guesses(tries, top=10, metric='entropy', hard=False, solver=None):
+    return (solver or default_solver()).rank(tries, top, metric, hard)
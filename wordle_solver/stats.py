@@ -0,0 +1,68 @@
+import json
+import logging
+import time
+from contextlib import contextmanager, nullcontext
+
+
+class Stats:
+    """
+    Wall time per stage and counters for one solve.
+
+    Solving without --stats or stats_hooks uses NO_STATS instead, whose stages are a shared
+    no-op context, so the instrumentation costs next to nothing.
+    """
+
+    def __init__(self):
+        self.stages = {}
+        self.counters = {}
+
+    def __bool__(self):
+        return True
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record(self, name, seconds):
+        self.stages[name] = self.stages.get(name, 0) + seconds
+
+    def add(self, counter, value):
+        self.counters[counter] = self.counters.get(counter, 0) + value
+
+    def as_dict(self):
+        return {'stages': self.stages, 'total': sum(self.stages.values()), **self.counters}
+
+
+class _NoStats:
+    _stage = nullcontext()
+
+    def __bool__(self):
+        return False
+
+    def stage(self, name):
+        return self._stage
+
+    def record(self, name, seconds):
+        pass
+
+    def add(self, counter, value):
+        pass
+
+
+NO_STATS = _NoStats()
+
+# Called with Stats.as_dict() after every solve, for callers embedding the solver
+stats_hooks = []
+logger = logging.getLogger('wordle-solver')
+
+
+def report_stats(stats):
+    if not stats:
+        return
+    logger.info('solve %s', json.dumps(stats.as_dict()))
+    for hook in stats_hooks:
+        hook(stats.as_dict())
@@ -0,0 +1,126 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .game import ALL_GREEN
+from .ranking import best_guesses
+
+
+class Strategy:
+    """
+    Plays the best-ranked guess, or a remaining candidate once at most two are left.
+
+    The guess for each history is remembered, so replaying many games only ranks each
+    distinct position once.
+    """
+
+    def __init__(self, table, opener=None, metric='entropy'):
+        self.table = table
+        self.metric = metric
+        self.opener = opener or best_guesses(table, np.arange(len(table.answers)), 1, metric)[0][0]
+        self.memo = {}
+
+    def guess(self, history, candidates):
+        if not history:
+            return self.opener
+        key = tuple(history)
+        if key not in self.memo:
+            if len(candidates) <= 2:
+                self.memo[key] = self.table.answers[candidates[0]]
+            else:
+                self.memo[key] = best_guesses(self.table, candidates, 1, self.metric)[0][0]
+        return self.memo[key]
+
+    def play(self, answer, max_guesses=20):
+        """Guesses made for the answer at the given index, as (word, pattern code) pairs."""
+        candidates = np.arange(len(self.table.answers))
+        history = []
+        while len(history) < max_guesses:
+            guess = self.guess(history, candidates)
+            row = self.table.row(guess)
+            history.append((guess, int(row[answer])))
+            if row[answer] == ALL_GREEN:
+                break
+            candidates = candidates[row[candidates] == row[answer]]
+        return history
+
+
+_worker_state = None
+
+
+def _init_worker(state):
+    global _worker_state
+    _worker_state = state
+
+
+def worker_state():
+    """The state given to worker_pool, inside one of its processes."""
+    return _worker_state
+
+
+def worker_count(workers=None):
+    """Processes to use, one per CPU by default, or just this one where workers cannot be forked."""
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        return 1
+    return workers or os.cpu_count()
+
+
+def worker_pool(state, workers):
+    """A pool of worker processes in which worker_state() returns state."""
+    # Forked workers inherit the table instead of having it pickled to them
+    return ProcessPoolExecutor(workers, multiprocessing.get_context('fork'),
+                               initializer=_init_worker, initargs=(state,))
+
+
+def _play_games(answers):
+    return [len(worker_state().play(a)) for a in answers]
+
+
+def _build_branch(code):
+    strategy = worker_state()
+    candidates = np.flatnonzero(strategy.table.row(strategy.opener) == code)
+    return build_tree(strategy, candidates, ((strategy.opener, code),))
+
+
+def simulate_games(strategy, answers, workers=None):
+    """Number of guesses the strategy needs for each answer index, played across processes."""
+    workers = worker_count(workers)
+    if workers == 1:
+        return [len(strategy.play(a)) for a in answers]
+    # Answers giving the same feedback to the opener share every later position, so each
+    # worker gets whole branches and ranks them once, the largest first
+    answers = np.asarray(answers)
+    codes = strategy.table.row(strategy.opener)[answers]
+    values, sizes = np.unique(codes, return_counts=True)
+    branches = [np.flatnonzero(codes == c) for c in values[np.argsort(-sizes, kind='stable')]]
+    guesses = np.empty(len(answers), dtype=int)
+    with worker_pool(strategy, workers) as executor:
+        for branch, counts in zip(branches, executor.map(_play_games, [answers[b] for b in branches])):
+            guesses[branch] = counts
+    return guesses.tolist()
+
+
+def build_tree(strategy, candidates, history=()):
+    """The strategy's play from a position, as nested (guess, {pattern code: subtree}) pairs."""
+    guess = strategy.guess(history, candidates)
+    codes = strategy.table.row(guess)[candidates]
+    children = {}
+    for code in np.unique(codes):
+        if code != ALL_GREEN:
+            children[int(code)] = build_tree(strategy, candidates[codes == code], history + ((guess, int(code)),))
+    return guess, children
+
+
+def build_tree_parallel(strategy, workers=None):
+    """Same as build_tree from the start of a game, with the opener's branches built across processes."""
+    workers = worker_count(workers)
+    if workers == 1:
+        return build_tree(strategy, np.arange(len(strategy.table.answers)))
+    codes, sizes = np.unique(strategy.table.row(strategy.opener), return_counts=True)
+    # Largest branches first so no worker is left with a big one at the end
+    branches = [int(c) for c in codes[np.argsort(-sizes)] if c != ALL_GREEN]
+    with worker_pool(strategy, workers) as executor:
+        children = dict(zip(branches, executor.map(_build_branch, branches)))
+    return strategy.opener, children
@@ -0,0 +1,129 @@
+import os
+import tempfile
+from functools import cached_property
+
+import numpy as np
+
+from .clues import encode, letter_counts
+from .stats import logger
+from .words import word_list_digest
+
+
+class PatternTable:
+    """
+    Feedback of every guess against every answer, as a (guesses x answers) uint8 array.
+
+    A pattern such as "01122" is stored as the base-3 number it spells, so int(outputs, 3)
+    gives the code to compare a row against.
+
+    With a cache_dir the array is saved there on first use and memory-mapped afterwards,
+    so later processes start in milliseconds and share the same pages. The file is only
+    readable by its owner, so other users build their own, and a table is kept for each pair
+    of word lists ever used until the directory is cleared by hand.
+
+    weights, if given, is a float array aligned with answers giving how likely each one is.
+    Rankings then score guesses against that prior instead of treating answers as equally likely.
+    """
+
+    def __init__(self, guesses, answers, cache_dir=None, weights=None):
+        self.guesses = guesses
+        self.answers = answers
+        self.weights = weights
+        self.guess_index = {w: i for i, w in enumerate(guesses)}
+        self.answer_guesses = np.array([self.guess_index.get(w, -1) for w in answers], dtype=np.intp)
+        self.answer_letters = encode(answers)
+        if cache_dir is None:
+            self.patterns = get_patterns(encode(guesses), self.answer_letters)
+        else:
+            # A plain view of the memmap, which is much cheaper to slice
+            self.patterns = np.asarray(load_patterns(guesses, answers, cache_dir))
+
+    @cached_property
+    def guess_letters(self):
+        return encode(self.guesses)
+
+    @cached_property
+    def guess_counts(self):
+        return letter_counts(self.guess_letters)
+
+    def row(self, word):
+        if word in self.guess_index:
+            return self.patterns[self.guess_index[word]]
+        return get_patterns(encode([word]), self.answer_letters)[0]
+
+    def by_weight(self, candidates):
+        """The candidate indices with the most likely first, or as they are without weights."""
+        if self.weights is None:
+            return candidates
+        return candidates[np.argsort(-self.weights[candidates], kind='stable')]
+
+    def filter(self, tries, candidates=None, stats=None):
+        if candidates is None:
+            candidates = np.arange(len(self.answers))
+        for attempt in tries:
+            word, outputs = attempt.split('=')
+            if stats:
+                stats.add('tested', len(candidates))
+            candidates = candidates[self.row(word)[candidates] == int(outputs, 3)]
+        if stats:
+            stats.add('survivors', len(candidates))
+        return candidates
+
+
+def default_cache_dir():
+    return os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'wordle-solver')
+
+
+def load_patterns(guesses, answers, cache_dir):
+    path = os.path.join(cache_dir, f'patterns-{word_list_digest(guesses, answers)[:16]}.npy')
+    try:
+        patterns = np.load(path, mmap_mode='r')
+        if patterns.shape == (len(guesses), len(answers)) and patterns.dtype == np.uint8:
+            return patterns
+    except (OSError, ValueError):
+        pass
+
+    patterns = get_patterns(encode(guesses), encode(answers))
+    f = None
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write to a temporary file first so concurrent processes never map a half-written table
+        with tempfile.NamedTemporaryFile(dir=cache_dir, suffix='.tmp', delete=False) as f:
+            np.save(f, patterns)
+        os.replace(f.name, path)
+    except OSError as e:
+        logger.warning('Could not cache the pattern table in %s: %s', cache_dir, e)
+        # Don't leave a partial copy of the table behind on every run, say on a full disk
+        if f is not None and os.path.exists(f.name):
+            os.remove(f.name)
+        return patterns
+    return np.load(path, mmap_mode='r')
+
+
+def get_patterns(guesses, answers, block_size=512):
+    counts = np.ascontiguousarray(letter_counts(answers).T)
+
+    # Guesses without repeated letters skip the duplicate bookkeeping, so keep them in their own blocks
+    repeats = (guesses[:, :, None] == guesses[:, None, :]).sum(axis=(1, 2)) > 5
+    order = np.argsort(repeats, kind='stable')
+    result = np.empty((len(guesses), len(answers)), dtype=np.uint8)
+    for start in range(0, len(guesses), block_size):
+        rows = order[start:start + block_size]
+        g = guesses[rows]
+        green = [g[:, i, None] == answers[None, :, i] for i in range(5)]
+        codes = np.zeros((len(g), len(answers)), dtype=np.uint8)
+        for i in range(5):
+            same = g == g[:, i:i + 1]
+            # Copies of the letter not used up by greens are handed out as yellows left to right
+            available = counts[g[:, i]] - green[i]
+            seen = np.zeros_like(available)
+            for j in range(5):
+                if j != i and same[:, j].any():
+                    available -= green[j] & same[:, j, None]
+                    if j < i:
+                        seen += ~green[j] & same[:, j, None]
+            codes *= 3
+            codes += green[i] * np.uint8(2)
+            codes += ~green[i] & (seen < available)
+        result[rows] = codes
+    return result
@@ -0,0 +1,70 @@
+import mmap
+import struct
+
+from .game import ALL_GREEN
+
+
+class DecisionTree:
+    """
+    A strategy tree saved by save_tree, read straight from a memory map.
+
+    Each node is the 5-letter guess, a child count and (pattern code, offset) pairs sorted by
+    code, so answering a history only touches the nodes along its path.
+    """
+
+    MAGIC = b'WSTREE1\n'
+    HEADER = struct.Struct('<8s32sI')
+    NODE = struct.Struct('<5sB')
+    CHILD = struct.Struct('<BI')
+
+    def __init__(self, path, digest=None):
+        with open(path, 'rb') as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.data) < self.HEADER.size:
+            raise ValueError(f'{path} is not a decision tree file')
+        magic, tree_digest, self.root = self.HEADER.unpack_from(self.data)
+        if magic != self.MAGIC:
+            raise ValueError(f'{path} is not a decision tree file')
+        if digest is not None and tree_digest != bytes.fromhex(digest):
+            raise ValueError(f'{path} was built from a different word list')
+
+    def node(self, offset):
+        try:
+            guess, n = self.NODE.unpack_from(self.data, offset)
+            children = [self.CHILD.unpack_from(self.data, offset + self.NODE.size + i * self.CHILD.size)
+                        for i in range(n)]
+        except struct.error:
+            raise ValueError('The decision tree file is truncated') from None
+        return guess.decode('ascii'), dict(children)
+
+    def next_guess(self, tries):
+        """The tree's guess after the given tries, or None once the word is found."""
+        offset = self.root
+        for attempt in tries:
+            word, outputs = attempt.split('=')
+            guess, children = self.node(offset)
+            if word != guess:
+                raise ValueError(f'The tree plays {guess} here, not {word}')
+            if int(outputs, 3) == ALL_GREEN:
+                return None
+            if int(outputs, 3) not in children:
+                raise ValueError(f'No word left gives {attempt}')
+            offset = children[int(outputs, 3)]
+        return self.node(offset)[0]
+
+
+def save_tree(tree, path, digest):
+    def write(node):
+        guess, children = node
+        offsets = {code: write(child) for code, child in sorted(children.items())}
+        offset = f.tell()
+        f.write(DecisionTree.NODE.pack(guess.encode('ascii'), len(children)))
+        for code in sorted(offsets):
+            f.write(DecisionTree.CHILD.pack(code, offsets[code]))
+        return offset
+
+    with open(path, 'wb') as f:
+        f.seek(DecisionTree.HEADER.size)
+        root = write(tree)
+        f.seek(0)
+        f.write(DecisionTree.HEADER.pack(DecisionTree.MAGIC, bytes.fromhex(digest), root))
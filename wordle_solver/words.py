@@ -0,0 +1,111 @@
+import hashlib
+from functools import lru_cache
+
+import numpy as np
+
+PACKED_WORDS_MAGIC = b'WSWORDS1'
+
+
+class Words(list):
+    """A list of words that carries their letter codes from a packed file, so encode is free."""
+    letters = None
+
+
+@lru_cache(maxsize=None)
+def default_words():
+    from ._dwyl import WORDS
+    return WORDS.split()
+
+
+def word_lists(words=None, answers=None):
+    """
+    The allowed guesses and possible answers, each given as a list of words or a path for
+    read_words, defaulting to the built-in list. Any answer missing from the guesses is added
+    to them, since it can always be played.
+    """
+    guesses = default_words() if words is None else read_words(words) if _is_path(words) else list(words)
+    answers = guesses if answers is None else read_words(answers) if _is_path(answers) else list(answers)
+    known = set(guesses)
+    missing = [w for w in answers if w not in known]
+    return guesses + missing if missing else guesses, answers
+
+
+def _is_path(words):
+    return isinstance(words, (str, bytes)) or hasattr(words, '__fspath__')
+
+
+def read_words(path):
+    """
+    Words from a file written by pack_words, or from a text file with whitespace between words.
+
+    Packed files are the magic bytes followed by the words' ASCII letters, 5 bytes per word,
+    so they are read in one go without parsing. Their words come back as Words, keeping the
+    letters as an array for encode; the strings are still made for looking words up.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    if data.startswith(PACKED_WORDS_MAGIC):
+        letters = np.frombuffer(data, dtype=np.uint8, offset=len(PACKED_WORDS_MAGIC))
+        if len(letters) % 5 or not ((letters >= ord('a')) & (letters <= ord('z'))).all():
+            raise ValueError(f'{path} is not a valid packed word list')
+        if not len(letters):
+            raise ValueError(f'{path} has no words')
+        letters = letters.reshape(-1, 5)
+        # Splitting on spaces put between the words is the quickest way to the strings
+        spaced = np.full((len(letters), 6), ord(' '), dtype=np.uint8)
+        spaced[:, :5] = letters
+        words = Words(spaced.tobytes().decode('ascii').split())
+        words.letters = letters - ord('a')
+    else:
+        words = data.decode().lower().split()
+        if not words:
+            raise ValueError(f'{path} has no words')
+        joined = ''.join(words)
+        if set(map(len, words)) != {5} or not (joined.isascii() and joined.isalpha()):
+            invalid = [w for w in words if not (len(w) == 5 and w.isascii() and w.isalpha())]
+            raise ValueError(f'{path} has words that are not 5 letters long: {", ".join(invalid[:5])}')
+    if len(set(words)) < len(words):
+        words = list(dict.fromkeys(words))
+    return words
+
+
+def pack_words(words, path):
+    with open(path, 'wb') as f:
+        f.write(PACKED_WORDS_MAGIC + ''.join(words).encode('ascii'))
+
+
+def word_list_digest(guesses, answers):
+    return hashlib.sha256(' '.join(guesses).encode() + b'|' + ' '.join(answers).encode()).hexdigest()
+
+
+def read_weights(path):
+    """Word weights, such as frequency counts, from a text file with a word and a number per line."""
+    weights = {}
+    with open(path) as f:
+        for number, line in enumerate(f, 1):
+            fields = line.split()
+            if not fields:
+                continue
+            try:
+                word, weight = fields[0].lower(), float(fields[1])
+            except (IndexError, ValueError):
+                raise ValueError(f'{path}:{number}: expected a word and a weight, got {line.strip()!r}') from None
+            if not weight >= 0 or weight == float('inf'):
+                raise ValueError(f'{path}:{number}: invalid weight {fields[1]}')
+            weights[word] = weight
+    return weights
+
+
+def weight_array(weights, words):
+    """
+    Weights for words as a float array in the same order, from a dict or a path for read_weights.
+
+    Nothing weighs less than the lightest positive weight given, so every word stays possible.
+    """
+    if _is_path(weights):
+        weights = read_weights(weights)
+    positive = [w for w in weights.values() if w > 0]
+    if not positive:
+        raise ValueError('No word has a positive weight')
+    lightest = min(positive)
+    return np.maximum(np.array([weights.get(w, lightest) for w in words], dtype=float), lightest)